@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 import sys
 import argparse
-from src.cli.commands import main as cli_main
-from src.gui.app import run_gui
-from src.core.config import Config
+
+# The CLI and GUI stacks (pydantic, psutil, GTK) are imported lazily below,
+# after argument parsing: `--help` and argument errors never pay for them,
+# and a CLI launch never imports GTK (nor vice versa). Each game instance
+# spawns its own Python process, so this saves the cost per subprocess.
 
 def main():
     """
@@ -32,16 +34,20 @@ def main():
 
     args = parser.parse_args()
 
+    from src.core.config import Config
+
     # Run migration only if not launching from another process that already did it.
     if not args.parent_pid:
         Config.migrate_legacy_paths()
 
     if not args.game_name:
+        from src.gui.app import run_gui
         run_gui()
     else:
         if not args.profile:
             print("Error: --profile is required when a game_name is specified.", file=sys.stderr)
             sys.exit(1)
+        from src.cli.commands import main as cli_main
         cli_main(
             game_name=args.game_name,
             profile_name=args.profile,
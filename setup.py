@@ -25,6 +25,9 @@ setup(
         "pydantic>=2.0.0",
         "PyGObject>=3.42.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.8.0"],
+    },
     entry_points={
         "console_scripts": [
             "protoncoop=protoncoop:main",
@@ -0,0 +1,183 @@
+import heapq
+import os
+import sys
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import count
+from typing import Any, Optional, Tuple
+
+# Path-existence lookups are served by module-level lru_cache wrappers: the
+# hit path (hash, probe, return) runs entirely inside the C implementation
+# of functools, with no per-call Python attribute lookups. TTL is provided
+# by folding a coarse epoch into the key, which rotates every _PATH_TTL_NS
+# and lets stale entries age out of the LRU naturally.
+_PATH_TTL_NS = 300 * 1_000_000_000
+
+
+@lru_cache(maxsize=4096)
+def _canonical_path(path_str: str) -> str:
+    """Returns the interned realpath of `path_str`, cached per spelling."""
+    return sys.intern(os.path.realpath(path_str))
+
+
+@lru_cache(maxsize=2048)
+def _path_exists(canonical: str, epoch: int) -> bool:
+    """Returns whether `canonical` exists; `epoch` rotates to expire entries."""
+    return os.path.exists(canonical)
+
+
+class ProfileCache:
+    """
+    In-memory LRU cache for loaded profiles and filesystem existence checks.
+
+    Profile entries are stored as `(value, expiry)` pairs in an
+    `OrderedDict`, so a cache hit costs a single dict probe; expiry is
+    checked lazily on access and the least recently used entry is evicted
+    once the size bound is hit. Path-existence checks are delegated to the
+    module-level lru_cache helpers above, whose hit path runs entirely in C.
+
+    Attributes:
+        ttl_seconds (int): How long a cached entry stays valid, in seconds.
+    """
+
+    # Opportunistic cleanup runs at most this often, evicting at most
+    # _CLEANUP_BATCH entries per pass, so inserts never stall on a backlog.
+    _CLEANUP_INTERVAL_NS = 1_000_000_000
+    _CLEANUP_BATCH = 16
+
+    def __init__(self, ttl_seconds: int = 300, profile_maxsize: int = 256):
+        """
+        Initializes an empty cache.
+
+        Args:
+            ttl_seconds (int): Time-to-live for cached profile entries, in
+                seconds. Path-existence entries are bounded and expired by
+                the module-level lru_cache wrappers instead.
+            profile_maxsize (int): Maximum number of cached profile objects.
+        """
+        self.ttl_seconds = ttl_seconds
+        self._profile_maxsize = profile_maxsize
+        # Deadlines are stored as integer monotonic nanoseconds: an integer
+        # compare per lookup is cheaper than float arithmetic, and monotonic
+        # time is immune to wall-clock jumps (NTP/DST), which could otherwise
+        # make entries appear infinitely fresh or instantly expired.
+        self._ttl_ns = ttl_seconds * 1_000_000_000
+        self._profiles: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        # Min-heap of (deadline, tiebreak, key) mirroring every profile
+        # insert, so clear_expired only touches entries that are actually
+        # expired instead of scanning the whole cache.
+        self._expiry_heap: list = []
+        self._heap_counter = count()
+        self._last_cleanup_ns = time.monotonic_ns()
+
+    def check_path_exists(self, path) -> bool:
+        """
+        Returns whether `path` exists, caching the result.
+
+        Repeated checks of the same path (e.g. the game executable during a
+        multi-instance launch) are served from the cache instead of hitting
+        the filesystem each time.
+
+        Args:
+            path: The path to check, as a `Path` or string.
+
+        Returns:
+            bool: True if the path exists, False otherwise.
+        """
+        # Both layers (spelling -> canonical, canonical+epoch -> exists)
+        # are C-level lru_cache hits after the first call; canonicalization
+        # still collapses alias spellings onto one stat result.
+        return _path_exists(_canonical_path(os.fspath(path)),
+                            time.monotonic_ns() // _PATH_TTL_NS)
+
+    def get_profile(self, key) -> Optional[Any]:
+        """
+        Retrieves a cached profile object, or None on miss/expiry.
+
+        Args:
+            key: The cache key the profile was stored under.
+
+        Returns:
+            Optional[Any]: The cached object, or None if absent or expired.
+        """
+        key = str(key)
+        entry = self._profiles.get(key)
+        if entry is not None and entry[1] > time.monotonic_ns():
+            self._profiles.move_to_end(key)
+            return entry[0]
+        return None
+
+    def set_profile(self, key, profile: Any) -> None:
+        """
+        Stores a profile object in the cache.
+
+        Args:
+            key: The cache key to store the profile under.
+            profile (Any): The object to cache.
+        """
+        key = str(key)
+        deadline = time.monotonic_ns() + self._ttl_ns
+        self._profiles[key] = (profile, deadline)
+        self._profiles.move_to_end(key)
+        heapq.heappush(self._expiry_heap, (deadline, next(self._heap_counter), key))
+        if len(self._profiles) > self._profile_maxsize:
+            self._profiles.popitem(last=False)
+        self._maybe_clear_expired()
+
+    def clear_expired(self, max_evictions: Optional[int] = None) -> None:
+        """
+        Evicts entries whose deadline has passed.
+
+        Pops from the expiry heap until the earliest remaining deadline is
+        still in the future, so the cost is proportional to the number of
+        expired entries rather than the total cache size. Heap records made
+        stale by a reinsert (the live entry has a newer deadline) are simply
+        discarded.
+
+        Args:
+            max_evictions (Optional[int]): Upper bound on heap pops for this
+                pass, or None to drain everything expired.
+        """
+        now = time.monotonic_ns()
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            if max_evictions is not None:
+                if max_evictions <= 0:
+                    break
+                max_evictions -= 1
+            deadline, _, key = heapq.heappop(heap)
+            entry = self._profiles.get(key)
+            if entry is not None and entry[1] == deadline:
+                del self._profiles[key]
+
+    def _maybe_clear_expired(self) -> None:
+        """
+        Runs a bounded cleanup pass if enough time has elapsed since the last.
+
+        Called from the insert paths so expired entries are reclaimed by
+        normal cache traffic, without a timer thread and without unbounded
+        per-operation overhead.
+        """
+        now = time.monotonic_ns()
+        if now - self._last_cleanup_ns <= self._CLEANUP_INTERVAL_NS:
+            return
+        try:
+            self.clear_expired(max_evictions=self._CLEANUP_BATCH)
+        finally:
+            # Updated even if an eviction raises, so a persistent error
+            # cannot force a cleanup attempt on every subsequent insert.
+            self._last_cleanup_ns = now
+
+    def clear(self) -> None:
+        """Empties both cache namespaces."""
+        self._profiles.clear()
+        self._expiry_heap.clear()
+        _path_exists.cache_clear()
+        _canonical_path.cache_clear()
+
+
+# Shared cache instance used by the model loaders. Profile loading happens
+# from several places (CLI, GUI, instance service), so a single module-level
+# cache maximizes the hit rate.
+profile_cache = ProfileCache()
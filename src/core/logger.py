@@ -86,6 +86,31 @@ class Logger:
         """
         return self.logger.isEnabledFor(level)
 
+    def isEnabledFor(self, level: int) -> bool:
+        """
+        Public wrapper around the cached log level check.
+
+        Callers use this to skip building expensive log messages (f-strings
+        over large commands or file lists) when the level is filtered out.
+
+        Args:
+            level (int): The logging level to check (e.g., `logging.DEBUG`).
+
+        Returns:
+            bool: True if the level is enabled, False otherwise.
+        """
+        return self._should_log(level)
+
+    def debug(self, message: str):
+        """
+        Logs a debug message.
+
+        Args:
+            message (str): The message to log.
+        """
+        if self._should_log(logging.DEBUG):
+            self.logger.debug(message)
+
     def info(self, message: str):
         """
         Logs an informational message.
@@ -2,13 +2,19 @@ import json
 from pathlib import Path
 from typing import Optional, List, Dict
 
-from pydantic import BaseModel, ConfigDict, Field, validator
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used when absent.
+    orjson = None
 
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from ..core.cache import profile_cache
 from ..core.exceptions import ExecutableNotFoundError
 
 
 class Game(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     """
     Represents a game in the user's library.
 
@@ -26,6 +32,9 @@ class Game(BaseModel):
         apply_dxvk_vkd3d (bool): Whether to apply DXVK/VKD3D to prefixes for this game.
         winetricks_verbs (Optional[List[str]]): Winetricks verbs to run for this game.
         env_vars (Optional[Dict[str, str]]): Environment variables to set for this game.
+        per_instance_writable_paths (Optional[List[str]]): Paths relative to
+            the game directory (e.g. "Saves") that each instance needs its
+            own writable copy of, instead of sharing the read-only tree.
     """
     game_name: str = Field(..., alias="GAME_NAME")
     exe_path: Path = Field(..., alias="EXE_PATH")
@@ -36,39 +45,67 @@ class Game(BaseModel):
     apply_dxvk_vkd3d: bool = Field(default=True, alias="APPLY_DXVK_VKD3D")
     winetricks_verbs: Optional[List[str]] = Field(default=None, alias="WINETRICKS_VERBS")
     env_vars: Optional[Dict[str, str]] = Field(default_factory=dict, alias="ENV_VARS")
+    per_instance_writable_paths: Optional[List[str]] = Field(default=None, alias="PER_INSTANCE_WRITABLE_PATHS")
 
-    @validator('exe_path')
+    @field_validator('exe_path', mode='after')
+    @classmethod
     def validate_exe_path(cls, v):
-        """Validates that the executable path exists."""
+        """Validates that the executable path exists.
+
+        Re-validating the same path (sibling profiles pointing at one
+        executable, repeated model construction) costs no syscall: the
+        existence check is a cache hit after the first call.
+        """
         if v is None:
             return v
         path_v = Path(v)
-        if not path_v.exists():
+        if not profile_cache.check_path_exists(path_v):
             raise ExecutableNotFoundError(f"Game executable not found: {path_v}")
         return path_v
 
-    @validator('game_name')
+    @field_validator('game_name', mode='after')
+    @classmethod
     def sanitize_game_name(cls, v):
         """Sanitizes the game name."""
         return v.strip()
 
     @classmethod
     def load_from_file(cls, file_path: Path) -> "Game":
-        """Loads a game from a JSON file."""
-        if not file_path.exists():
-            raise FileNotFoundError(f"Game file not found: {file_path}")
-        with file_path.open('r', encoding='utf-8') as f:
-            data = json.load(f)
+        """Loads a game from a JSON file, serving repeat loads from cache."""
+        # Cache the validated model under the file's stat fingerprint: a
+        # cache hit returns the already-validated Game, so neither Pydantic
+        # validation nor the executable existence stat runs again. Edited
+        # files change the fingerprint and miss naturally.
+        try:
+            st = file_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Game file not found: {file_path}") from None
+        cache_key = (str(file_path), st.st_mtime_ns, st.st_size)
+        cached = profile_cache.get_profile(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            raw = file_path.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Game file not found: {file_path}") from None
 
-        # Infer is_native if not present
+        # Infer is_native if not present. Lowercasing only the 4-char tail
+        # avoids allocating a full lowercase copy of the path.
         if 'IS_NATIVE' not in data:
             exe_path_str = data.get('EXE_PATH')
-            data['IS_NATIVE'] = bool(exe_path_str and not exe_path_str.lower().endswith('.exe'))
+            data['IS_NATIVE'] = bool(exe_path_str and exe_path_str[-4:].lower() != '.exe')
 
-        return cls.model_validate(data)
+        game = cls.model_validate(data)
+        profile_cache.set_profile(cache_key, game)
+        return game
 
     def save_to_file(self, file_path: Path):
         """Saves the game to a JSON file."""
         file_path.parent.mkdir(parents=True, exist_ok=True)
         json_data = self.model_dump_json(by_alias=True, indent=4)
-        file_path.write_text(json_data, encoding='utf-8')
\ No newline at end of file
+        file_path.write_text(json_data, encoding='utf-8')
+        # Keep the cache coherent with what was just written to disk.
+        st = file_path.stat()
+        profile_cache.set_profile((str(file_path), st.st_mtime_ns, st.st_size), self)
\ No newline at end of file
@@ -30,6 +30,9 @@ class GameInstance(BaseModel):
             instance.
         is_native (bool): A flag indicating whether this is a native Linux
             game, which affects cleanup procedures (e.g., skipping `wineserver -k`).
+        device_info (Optional[dict]): The validated input-device information
+            for this instance, computed once at launch and reused by every
+            step that needs it.
     """
     instance_num: int
     profile_name: str
@@ -39,6 +42,7 @@ class GameInstance(BaseModel):
     gamescope_pid: Optional[int] = None
     player_config: Optional[PlayerInstanceConfig] = None
     is_native: bool = False
+    device_info: Optional[dict] = None
 
     def __init__(self, **data):
         """
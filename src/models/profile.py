@@ -1,22 +1,42 @@
 import json
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import List, Optional, Any, Tuple
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used when absent.
+    orjson = None
+
+# Files at least this large (one page) are parsed via mmap instead of a
+# read() copy; smaller ones aren't worth the mapping overhead.
+_MMAP_THRESHOLD = mmap.PAGESIZE
+
+_VALID_ORIENTATIONS = frozenset({"horizontal", "vertical"})
 
 from pydantic import (BaseModel, ConfigDict, Field, ValidationError,
-                      validator)
+                      field_validator, model_validator)
+from pydantic.dataclasses import dataclass as pydantic_dataclass
 
+from ..core.cache import profile_cache
 from ..core.config import Config
 from ..core.exceptions import ProfileNotFoundError
 from ..core.logger import Logger
 from .game import Game
 
 
-class PlayerInstanceConfig(BaseModel):
+@pydantic_dataclass(frozen=True, slots=True,
+                    config=ConfigDict(populate_by_name=True))
+class PlayerInstanceConfig:
     """
     Defines the specific configuration for a single player's game instance.
-    """
-    model_config = ConfigDict(populate_by_name=True)
 
+    Declared as a frozen, slotted Pydantic dataclass: instances carry no
+    per-object `__dict__`, which matters when many profiles with several
+    players each are resident (GUI library views, cached loads).
+    """
     ACCOUNT_NAME: Optional[str] = Field(default=None, alias="ACCOUNT_NAME")
     LANGUAGE: Optional[str] = Field(default=None, alias="LANGUAGE")
     LISTEN_PORT: Optional[str] = Field(default=None, alias="LISTEN_PORT")
@@ -32,12 +52,13 @@ class SplitscreenConfig(BaseModel):
     """
     Configuration for splitscreen mode.
     """
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
     orientation: str = Field(alias="ORIENTATION")
 
-    @validator('orientation')
+    @field_validator('orientation', mode='after')
+    @classmethod
     def validate_orientation(cls, v):
-        if v not in ["horizontal", "vertical"]:
+        if v not in _VALID_ORIENTATIONS:
             raise ValueError("Orientation must be 'horizontal' or 'vertical'.")
         return v
 
@@ -49,7 +70,10 @@ class Profile(BaseModel):
     This model holds settings that can vary between different playthroughs
     of the same game, such as player counts, Proton versions, and device configs.
     """
-    model_config = ConfigDict(populate_by_name=True, extra='allow')
+    # defer_build postpones pydantic-core schema compilation from module
+    # import to first validation, so invocations that never construct a
+    # model (e.g. --help) skip the compile cost entirely.
+    model_config = ConfigDict(populate_by_name=True, extra='allow', defer_build=True)
 
     profile_name: str = Field(..., alias="PROFILE_NAME")
     num_players: int = Field(..., alias="NUM_PLAYERS")
@@ -60,7 +84,41 @@ class Profile(BaseModel):
     player_configs: Optional[List[PlayerInstanceConfig]] = Field(default=None, alias="PLAYERS")
     selected_players: Optional[List[int]] = Field(default=None, alias="selected_players")
 
-    @validator('num_players')
+    @model_validator(mode='before')
+    @classmethod
+    def _fold_legacy_device_lists(cls, data):
+        """
+        Folds legacy parallel device lists into per-player PLAYERS entries.
+
+        Old profiles stored devices as three independent lists indexed by
+        player number (PLAYER_PHYSICAL_DEVICE_IDS, PLAYER_MOUSE_EVENT_PATHS,
+        PLAYER_KEYBOARD_EVENT_PATHS). Zip them into the per-player config
+        dicts so the rest of the application only ever sees one structure
+        per player, with nothing to keep in sync across three lists.
+        """
+        if not isinstance(data, dict):
+            return data
+        ids = data.pop('PLAYER_PHYSICAL_DEVICE_IDS', None) or []
+        mice = data.pop('PLAYER_MOUSE_EVENT_PATHS', None) or []
+        keyboards = data.pop('PLAYER_KEYBOARD_EVENT_PATHS', None) or []
+        if not (ids or mice or keyboards):
+            return data
+
+        num_players = max(len(ids), len(mice), len(keyboards))
+        players = data.setdefault('PLAYERS', [{} for _ in range(num_players)])
+        legacy_keys = (('PHYSICAL_DEVICE_ID', ids),
+                       ('MOUSE_EVENT_PATH', mice),
+                       ('KEYBOARD_EVENT_PATH', keyboards))
+        for i, player in enumerate(players):
+            if not isinstance(player, dict):
+                continue
+            for key, values in legacy_keys:
+                if i < len(values) and values[i] and not player.get(key):
+                    player[key] = values[i]
+        return data
+
+    @field_validator('num_players', mode='after')
+    @classmethod
     def validate_num_players(cls, v):
         if not (1 <= v <= 4):
             raise ValueError("The number of players must be between 1 and 4.")
@@ -68,14 +126,38 @@ class Profile(BaseModel):
 
     @classmethod
     def load_from_file(cls, profile_path: Path) -> "Profile":
-        """Loads a profile from a JSON file."""
-        if not profile_path.exists():
-            raise ProfileNotFoundError(f"Profile not found: {profile_path}")
+        """Loads a profile from a JSON file, serving repeat loads from cache."""
+        # Key the cache on the file's stat fingerprint rather than the path
+        # alone: an edited profile misses the cache immediately instead of
+        # being served stale until the TTL runs out. The stat doubles as the
+        # existence check, so no separate exists() syscall is needed.
+        try:
+            st = profile_path.stat()
+        except FileNotFoundError as e:
+            raise ProfileNotFoundError(f"Profile not found: {profile_path}") from e
+        cache_key = (str(profile_path), st.st_mtime_ns, st.st_size)
+        cached = profile_cache.get_profile(cache_key)
+        if cached is not None:
+            return cached
 
         try:
-            with open(profile_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-        except (IOError, json.JSONDecodeError) as e:
+            if orjson is not None and st.st_size >= _MMAP_THRESHOLD:
+                # Large profiles are parsed straight off the page cache: the
+                # kernel maps the file into the process and orjson reads the
+                # buffer without an intermediate read() copy.
+                with open(profile_path, 'rb') as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        data = orjson.loads(memoryview(mm))
+            else:
+                # Below one page the mmap setup costs more than it saves.
+                # orjson parses config-sized payloads several times faster
+                # than the stdlib and skips the text-decode step entirely.
+                raw = profile_path.read_bytes()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except FileNotFoundError as e:
+            # The file vanished between the stat and the read.
+            raise ProfileNotFoundError(f"Profile not found: {profile_path}") from e
+        except (IOError, ValueError) as e:
             raise ValueError(f"Error reading profile file {profile_path}: {e}")
 
         # Ensure profile_name is set from filename if not present
@@ -90,6 +172,7 @@ class Profile(BaseModel):
         except ValidationError as e:
             Logger("LinuxCoop", Config.LOG_DIR).error(f"Pydantic Validation Error for {profile_path}: {e.errors()}")
             raise ValueError(f"Profile data validation failed: {e}")
+        profile_cache.set_profile(cache_key, profile)
         return profile
 
     def save_to_file(self, profile_path: Path):
@@ -97,6 +180,32 @@ class Profile(BaseModel):
         profile_path.parent.mkdir(parents=True, exist_ok=True)
         json_data = self.model_dump_json(by_alias=True, indent=4)
         profile_path.write_text(json_data, encoding='utf-8')
+        # Keep the cache coherent with what was just written to disk.
+        st = profile_path.stat()
+        profile_cache.set_profile((str(profile_path), st.st_mtime_ns, st.st_size), self)
+
+    def prewarm_device_path_cache(self) -> None:
+        """
+        Warms the existence cache for all configured player device paths.
+
+        Device nodes (joysticks, mouse/keyboard event devices) are statted
+        one by one during instance launch. Issuing all the checks at once on
+        a small thread pool lets the kernel serve them concurrently, so the
+        later sequential lookups are pure cache hits. Missing devices are
+        not an error here; the launch path decides how to handle them.
+        """
+        paths = [
+            path
+            for config in (self.player_configs or [])
+            for path in (config.PHYSICAL_DEVICE_ID, config.MOUSE_EVENT_PATH,
+                         config.KEYBOARD_EVENT_PATH)
+            if path and path.strip()
+        ]
+        if len(paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+                pool.map(profile_cache.check_path_exists, paths)
+        elif paths:
+            profile_cache.check_path_exists(paths[0])
 
     @property
     def is_splitscreen_mode(self) -> bool:
@@ -130,6 +239,23 @@ class GameProfile:
     def is_splitscreen_mode(self) -> bool:
         return self._profile.mode == "splitscreen"
 
+    @cached_property
+    def gamescope_base_args(self) -> Tuple[str, ...]:
+        """The gamescope flags that are identical for every instance.
+
+        Computed once per GameProfile; the launch path only splices in the
+        per-instance width/height and grab flags around this tuple.
+        """
+        args = [
+            '-b',  # Use borderless instead of fullscreen for better compatibility
+            '-o', '999',  # Unfocused FPS limit
+            '-r', '999',  # Focused FPS limit
+        ]
+        # Add adaptive sync if not in splitscreen mode
+        if not self.is_splitscreen_mode:
+            args.append('--adaptive-sync')
+        return tuple(args)
+
     def effective_num_players(self) -> int:
         if self._profile.selected_players:
             return len(self._profile.selected_players)
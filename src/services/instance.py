@@ -1,5 +1,10 @@
+import functools
+import itertools
+import logging
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait as futures_wait
 import shutil
 import signal
 import subprocess
@@ -7,7 +12,8 @@ import shlex
 import stat
 from pathlib import Path
 import psutil
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
+from ..core.cache import profile_cache
 from ..core.config import Config
 from ..core.exceptions import DependencyError
 from ..core.logger import Logger
@@ -18,28 +24,89 @@ from .dependency_manager import DependencyManager
 
 class InstanceService:
     """Service responsible for managing game instances, including dependency validation, creation, launching, and monitoring."""
+
+    # The bwrap flags shared by every instance. Order matters: the /dev/input
+    # tmpfs must be mounted before any per-device --dev-bind into it, so the
+    # dynamic parts are always appended after this base.
+    _BWRAP_BASE: Tuple[str, ...] = (
+        'bwrap',
+        '--die-with-parent',
+        '--dev-bind', '/', '/',
+        '--proc', '/proc',
+        '--tmpfs', '/tmp',
+        '--cap-add', 'all',
+        '--share-net',
+        '--tmpfs', '/dev/input',
+    )
+
     def __init__(self, logger: Logger):
         """Initializes the instance service with logger and ProtonService."""
         self.logger = logger
         self.proton_service = ProtonService(logger)
         self.pids: List[int] = []
+        self._pgids: List[int] = []
+        self._procs: List[psutil.Process] = []
+        # Guards pids/_pgids/_procs when launches run on the fan-out pool.
+        self._pids_lock = threading.Lock()
         self.managed_instances: List[GameInstance] = []
         self.cpu_count = psutil.cpu_count(logical=True)
         self.proton_path: Optional[Path] = None
         self.termination_in_progress = False
+        # Shared pool for filesystem-heavy work (symlink mirroring). symlink
+        # and stat release the GIL, so subtree jobs overlap on real I/O.
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 4) * 4),
+            thread_name_prefix="lc-io"
+        )
+        self._shared_game_root: Optional[Path] = None
+        self._base_env: Optional[Dict[str, str]] = None
+        self._cores_by_socket = self._read_core_topology()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _which(cmd: str) -> Optional[str]:
+        """Memoized shutil.which: each command walks $PATH at most once per run."""
+        return shutil.which(cmd)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _path_executables(path_env: str) -> frozenset:
+        """Returns the names of all executables reachable through `path_env`.
+
+        One scandir sweep per $PATH directory replaces the per-command
+        directory probing shutil.which would do, so checking any number of
+        required commands costs O(dirs + files) syscalls total. Keyed on
+        the $PATH string itself, so a changed PATH naturally re-scans.
+        """
+        executables = set()
+        for directory in path_env.split(os.pathsep):
+            if not directory:
+                continue
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_file() and entry.stat().st_mode & 0o111:
+                                executables.add(entry.name)
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+        return frozenset(executables)
 
     def validate_dependencies(self) -> None:
         """Validates if all necessary commands are available on the system."""
         self.logger.info("Validating dependencies...")
-        for cmd in Config.REQUIRED_COMMANDS:
-            if not shutil.which(cmd):
-                raise DependencyError(f"Required command '{cmd}' not found")
+        exe_names = self._path_executables(os.environ.get('PATH', ''))
+        missing = [cmd for cmd in Config.REQUIRED_COMMANDS if cmd not in exe_names]
+        if missing:
+            raise DependencyError(f"Required command '{missing[0]}' not found")
         self.logger.info("Dependencies validated successfully")
 
     def launch_instances(self, profile: GameProfile, profile_name: str) -> None:
             """Launches all game instances according to the provided profile."""
             if not profile.exe_path:
-                self.logger.errgor(f"Executable path is not configured for profile '{profile_name}'. Cannot launch.")
+                self.logger.error(f"Executable path is not configured for profile '{profile_name}'. Cannot launch.")
                 return
 
             # # Validate gamescope if needed
@@ -72,6 +139,10 @@ class InstanceService:
             for directory in directories:
                 directory.mkdir(parents=True, exist_ok=True)
 
+            # Warm the existence cache for all player device paths in one
+            # concurrent sweep; the per-instance checks below then hit it.
+            profile.prewarm_device_path_cache()
+
             instances = self._create_instances(profile, profile_name, proton_path, steam_root)
 
             # Calculate CPU core assignments for each instance
@@ -80,40 +151,118 @@ class InstanceService:
                 self.logger.info("No instances to launch.")
                 return
 
-            cores_per_instance = self.cpu_count // num_instances
-            remaining_cores = self.cpu_count % num_instances
-            core_assignments = []
-            current_core_start = 0
-
-            for i in range(num_instances):
-                num_cores_for_instance = cores_per_instance
-                if remaining_cores > 0:
-                    num_cores_for_instance += 1
-                    remaining_cores -= 1
-
-                # Build the core string, e.g., "0-3" or "4,5,6"
-                cores_list = []
-                for j in range(num_cores_for_instance):
-                    cores_list.append(str(current_core_start + j))
-                core_assignments.append(",".join(cores_list))
-                current_core_start += num_cores_for_instance
+            core_assignments = self._assign_cores(num_instances)
 
             self.logger.info(f"Launching {num_instances} instance(s) of '{profile.game_name}'...")
 
             original_game_path = profile.exe_path.parent
 
-            for i, instance in enumerate(instances):
-                cpu_affinity = core_assignments[i]
-                self._launch_single_instance(instance, profile, proton_path, steam_root, original_game_path, cpu_affinity)
-                time.sleep(5)
+            # Compute the invariant part of the environment once; each
+            # instance only overlays its handful of per-instance keys.
+            self._base_env = self._build_base_env(profile, steam_root, proton_path)
+
+            # Mirror the game directory once; every instance links to it.
+            self._shared_game_root = self._ensure_shared_game_tree(profile, original_game_path)
+
+            # Per-instance prep is independent (shared game tree and base env
+            # are built above), so fork+exec of all instances can overlap.
+            # A 0.1 s submit stagger avoids Wine prefix-creation write races.
+            with ThreadPoolExecutor(max_workers=num_instances, thread_name_prefix="lc-launch") as launch_pool:
+                futures = []
+                for i, instance in enumerate(instances):
+                    futures.append(launch_pool.submit(
+                        self._launch_single_instance, instance, profile, proton_path,
+                        steam_root, original_game_path, core_assignments[i]
+                    ))
+                    if i < num_instances - 1:
+                        time.sleep(0.1)
+                for future in futures:
+                    future.result()
 
             self.logger.info(f"All {num_instances} instances launched")
             self.logger.info(f"PIDs: {self.pids}")
             self.logger.info("Press CTRL+C to terminate all instances")
 
+    def _read_core_topology(self) -> Dict[int, List[int]]:
+        """Groups logical cores by physical socket, SMT primaries first.
+
+        Reads /sys/devices/system/cpu/cpu*/topology. Within each socket the
+        list is ordered so that one logical core per physical core comes
+        before any of its SMT siblings; consumers taking a prefix of the
+        list therefore get distinct physical cores before doubling up.
+        Falls back to a single socket holding all cores when sysfs is
+        unavailable (containers, non-Linux).
+        """
+        primaries: Dict[int, List[int]] = {}
+        siblings: Dict[int, List[int]] = {}
+        try:
+            for cpu in range(self.cpu_count):
+                topo = f"/sys/devices/system/cpu/cpu{cpu}/topology"
+                with open(f"{topo}/physical_package_id") as f:
+                    socket_id = int(f.read())
+                try:
+                    with open(f"{topo}/thread_siblings_list") as f:
+                        first_sibling = int(f.read().split(',')[0].split('-')[0])
+                except OSError:
+                    first_sibling = cpu
+                bucket = primaries if cpu == first_sibling else siblings
+                bucket.setdefault(socket_id, []).append(cpu)
+        except (OSError, ValueError):
+            return {0: list(range(self.cpu_count))}
+        return {
+            socket_id: primaries.get(socket_id, []) + siblings.get(socket_id, [])
+            for socket_id in sorted(primaries.keys() | siblings.keys())
+        }
+
+    def _assign_cores(self, num_instances: int) -> List[frozenset]:
+        """Splits the cores evenly across instances, keeping each on one socket.
+
+        Each instance draws its share from whichever socket currently has
+        the most unassigned cores, so on multi-socket machines instances
+        stay socket-local (no cross-socket memory traffic) and only spill
+        over when one instance needs more than a single socket holds.
+        """
+        base, extra = divmod(self.cpu_count, num_instances)
+        available = {socket_id: list(cores) for socket_id, cores in self._cores_by_socket.items()}
+
+        assignments: List[frozenset] = []
+        for i in range(num_instances):
+            wanted = base + (1 if i < extra else 0)
+            picked: List[int] = []
+            while wanted > 0 and any(available.values()):
+                socket_id = max(available, key=lambda s: len(available[s]))
+                take = available[socket_id][:wanted]
+                del available[socket_id][:wanted]
+                picked.extend(take)
+                wanted -= len(take)
+            assignments.append(frozenset(picked))
+        return assignments
+
+    def _setup_prefix(self, dependency_manager: DependencyManager, profile: GameProfile,
+                      instance_num: int, prefix_dir: Path, marker: Path) -> None:
+        """Runs the one-time prefix setup and records completion via a marker file.
+
+        The marker makes warm launches free: once initialize_prefix, DXVK and
+        winetricks have succeeded for a prefix, subsequent runs skip the
+        whole block instead of re-invoking minutes of wine tooling.
+        """
+        self.logger.info(f"Instance {instance_num}: DXVK/VKD3D or Winetricks verbs configured. Initializing prefix before launch.")
+        # Initialize the prefix first. This is a crucial, one-time setup.
+        dependency_manager.initialize_prefix(prefix_dir)
+
+        # Now, apply dependencies if configured
+        if profile.apply_dxvk_vkd3d:
+            dependency_manager.apply_dxvk_vkd3d(prefix_dir)
+        if profile.winetricks_verbs:
+            dependency_manager.apply_winetricks(prefix_dir, profile.winetricks_verbs)
+
+        marker.touch()
+        self.logger.info(f"Instance {instance_num}: Prefix setup complete.")
+
     def _create_instances(self, profile: GameProfile, profile_name: str, proton_path: Optional[Path], steam_root: Optional[Path]) -> List[GameInstance]:
         """Creates instance models for each player."""
         instances = []
+        setup_jobs: List[Tuple[int, Path, Path]] = []
 
         if not profile.is_native and proton_path and steam_root:
             dependency_manager = DependencyManager(self.logger, proton_path, steam_root)
@@ -141,15 +290,11 @@ class InstanceService:
                 # Only initialize the prefix if we intend to modify it with DXVK or Winetricks.
                 # Otherwise, we let Proton/Wine create it on the first actual game launch.
                 if profile.apply_dxvk_vkd3d or profile.winetricks_verbs:
-                    self.logger.info(f"Instance {instance_num}: DXVK/VKD3D or Winetricks verbs configured. Initializing prefix before launch.")
-                    # Initialize the prefix first. This is a crucial, one-time setup.
-                    dependency_manager.initialize_prefix(prefix_dir)
-
-                    # Now, apply dependencies if configured
-                    if profile.apply_dxvk_vkd3d:
-                        dependency_manager.apply_dxvk_vkd3d(prefix_dir)
-                    if profile.winetricks_verbs:
-                        dependency_manager.apply_winetricks(prefix_dir, profile.winetricks_verbs)
+                    marker = prefix_dir / ".linux_coop_ready"
+                    if marker.exists():
+                        self.logger.info(f"Instance {instance_num}: Prefix already set up (marker present). Skipping initialization.")
+                    else:
+                        setup_jobs.append((instance_num, prefix_dir, marker))
                 else:
                     self.logger.info(f"Instance {instance_num}: No prefix modifications required. Skipping explicit initialization.")
 
@@ -162,17 +307,51 @@ class InstanceService:
                 is_native=profile.is_native
             )
             instances.append(instance)
+
+        if setup_jobs:
+            # Prefixes are isolated from each other, so first-time setup can
+            # run concurrently. Wine tooling is disk/CPU heavy; bound the
+            # parallelism rather than matching the instance count.
+            with ThreadPoolExecutor(max_workers=min(len(setup_jobs), 4), thread_name_prefix="lc-prefix") as setup_pool:
+                futures = [
+                    setup_pool.submit(self._setup_prefix, dependency_manager, profile, instance_num, prefix_dir, marker)
+                    for instance_num, prefix_dir, marker in setup_jobs
+                ]
+                for future in as_completed(futures):
+                    future.result()
+
         self.managed_instances = instances
         return instances
 
+    def _ensure_shared_game_tree(self, profile: GameProfile, original_game_path: Path) -> Path:
+        """Idempotently mirrors the game directory into a per-game shared tree.
+
+        The mirror is pure read-only views (symlinks into the original game
+        folder), so one tree under the game's prefix base directory serves
+        every instance; re-running only fills in entries that are missing.
+        Mirror log lines attribute the work to instance 0.
+        """
+        shared_root = Config.get_prefix_base_dir(profile.game_name) / "game_files_shared" / original_game_path.name
+        created, skipped, failed = self._mirror_tree_parallel(
+            str(original_game_path), str(shared_root), 0
+        )
+        self.logger.info(
+            f"Shared game tree at {shared_root} "
+            f"({created} symlinks created, {skipped} existing files kept, {failed} failed)"
+        )
+        return shared_root
+
     def _create_game_directory_symlink_structure(self, instance: GameInstance, original_game_path: Path, original_exe_path: Path, profile: GameProfile) -> Path:
-        """Creates a mirrored directory structure with symlinks for the original game folder.
+        """Points the instance at the shared game tree, overlaying writable paths.
+
+        Without configured writable paths this is a single symlink from the
+        instance's game_files directory to the shared tree, regardless of
+        game size. Paths listed in the game's per_instance_writable_paths
+        are materialized as real per-instance copies so saves and similar
+        state don't collide between players.
         Returns the path to the main executable's symlink.
         """
         instance_game_root = instance.prefix_dir / "game_files" / original_game_path.name
-        instance_game_root.mkdir(parents=True, exist_ok=True)
-
-        self.logger.info(f"Instance {instance.instance_num}: Creating symlink structure for {original_game_path} at {instance_game_root}")
 
         # Determines the relative path of the original executable in relation to the game's root folder.
         try:
@@ -182,42 +361,133 @@ class InstanceService:
             self.logger.error(f"Instance {instance.instance_num}: Executable path {original_exe_path} is not inside game path {original_game_path}. Error: {e}")
             raise
 
+        shared_root = self._shared_game_root
+        if shared_root is None:
+            shared_root = self._shared_game_root = self._ensure_shared_game_tree(profile, original_game_path)
+
+        writable_paths = frozenset(
+            path.strip("/") for path in (profile.per_instance_writable_paths or []) if path and path.strip("/")
+        )
+        if writable_paths:
+            self.logger.info(
+                f"Instance {instance.instance_num}: Overlaying shared tree with writable paths: {sorted(writable_paths)}"
+            )
+            self._overlay_writable_tree(str(shared_root), str(instance_game_root), writable_paths, instance.instance_num)
+        else:
+            instance_game_root.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.symlink(shared_root, instance_game_root)
+                self.logger.info(f"Instance {instance.instance_num}: Linked game_files to shared tree {shared_root}")
+            except FileExistsError:
+                # Either a link from a previous run or a full mirror created
+                # by an older version; both already provide the game files.
+                pass
+
         # Expected path for the executable symlink
         symlinked_exe_path_target = instance_game_root / relative_exe_path
-
-        self._process_game_files(instance, original_game_path, instance_game_root, profile)
         self._verify_executable_symlink(instance, symlinked_exe_path_target, original_exe_path)
 
         return symlinked_exe_path_target
 
-    def _process_game_files(self, instance: GameInstance, original_game_path: Path, instance_game_root: Path, profile: GameProfile) -> None:
-        """Processes all game files, creating symlinks and configuring the Goldberg Emulator."""
-        self.logger.info(f"Instance {instance.instance_num}: Processing game files")
-
-        # Create directory structure
-        instance_game_root.mkdir(parents=True, exist_ok=True)
+    def _overlay_writable_tree(self, shared_dir: str, inst_dir: str, writable_paths: frozenset, instance_num: int, _prefix: str = "") -> None:
+        """Mirrors `shared_dir` into `inst_dir`, copying writable paths for real.
 
-        # Create symlinks for game files
-        for item in original_game_path.rglob("*"):
-            relative_item_path = item.relative_to(original_game_path)
-            target_path_for_item = instance_game_root / relative_item_path
+        Entries on a writable path are deep-copied (following the shared
+        tree's symlinks back to the original files); directories containing
+        a writable path deeper down are recursed into; everything else is a
+        plain symlink into the shared tree.
+        """
+        log_debug = self.logger.isEnabledFor(logging.DEBUG)
+        os.makedirs(inst_dir, exist_ok=True)
+        with os.scandir(shared_dir) as entries:
+            for entry in entries:
+                relative = _prefix + entry.name
+                dst = inst_dir + os.sep + entry.name
+                if relative in writable_paths:
+                    if os.path.lexists(dst):
+                        continue  # Keep the instance's existing copy (saves, etc.)
+                    try:
+                        if entry.is_dir(follow_symlinks=True):
+                            shutil.copytree(entry.path, dst, symlinks=False)
+                        else:
+                            shutil.copy2(entry.path, dst)
+                    except OSError as e:
+                        self.logger.warning(f"Instance {instance_num}: Failed to copy writable path '{relative}': {e}")
+                elif entry.is_dir(follow_symlinks=False) and any(w.startswith(relative + "/") for w in writable_paths):
+                    self._overlay_writable_tree(entry.path, dst, writable_paths, instance_num, relative + "/")
+                else:
+                    self._link_file(entry.path, dst, instance_num, log_debug)
 
-            # Ensures the parent directory exists
-            target_path_for_item.parent.mkdir(parents=True, exist_ok=True)
+    def _mirror_tree_parallel(self, src_dir: str, dst_dir: str, instance_num: int) -> Tuple[int, int, int]:
+        """Mirrors a directory tree, fanning top-level subtrees out to the I/O pool.
 
-            if item.is_dir():
-                target_path_for_item.mkdir(parents=True, exist_ok=True)
-            else:
-                # If a file already exists at the target path, log it and skip.
-                # This allows users to place custom/original files that won't be overwritten.
-                if target_path_for_item.exists():
-                    self.logger.info(f"Instance {instance.instance_num}: Skipped symlink, file already exists: {target_path_for_item}")
+        Each first-level subdirectory becomes one job on the shared pool, so
+        independent subtrees (and multiple instances) mirror concurrently;
+        top-level files are linked inline. Returns aggregate counts.
+        """
+        created = skipped = failed = 0
+        log_debug = self.logger.isEnabledFor(logging.DEBUG)
+        os.makedirs(dst_dir, exist_ok=True)
+        futures = []
+        with os.scandir(src_dir) as entries:
+            for entry in entries:
+                dst = dst_dir + os.sep + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    futures.append(self._io_pool.submit(self._mirror_tree, entry.path, dst, instance_num))
                 else:
-                    try:
-                        target_path_for_item.symlink_to(item)
-                        self.logger.info(f"Instance {instance.instance_num}: Created symlink: {target_path_for_item} -> {item}")
-                    except Exception as e:
-                        self.logger.warning(f"Instance {instance.instance_num}: Failed to create symlink for {item}: {e}")
+                    c, s, f = self._link_file(entry.path, dst, instance_num, log_debug)
+                    created += c
+                    skipped += s
+                    failed += f
+        futures_wait(futures)
+        for future in futures:
+            sub_created, sub_skipped, sub_failed = future.result()
+            created += sub_created
+            skipped += sub_skipped
+            failed += sub_failed
+        return created, skipped, failed
+
+    def _link_file(self, src: str, dst: str, instance_num: int, log_debug: bool) -> Tuple[int, int, int]:
+        """Symlinks a single file, returning (created, skipped, failed) deltas."""
+        try:
+            os.symlink(src, dst)
+            if log_debug:
+                self.logger.debug(f"Instance {instance_num}: Created symlink: {dst} -> {src}")
+            return 1, 0, 0
+        except FileExistsError:
+            if log_debug:
+                self.logger.debug(f"Instance {instance_num}: Skipped symlink, file already exists: {dst}")
+            return 0, 1, 0
+        except OSError as e:
+            self.logger.warning(f"Instance {instance_num}: Failed to create symlink for {src}: {e}")
+            return 0, 0, 1
+
+    def _mirror_tree(self, src_dir: str, dst_dir: str, instance_num: int) -> Tuple[int, int, int]:
+        """Recursively mirrors a directory tree with symlinks for every file.
+
+        Walks with os.scandir so each entry's type comes from the DirEntry's
+        cached stat, creates directories once per level instead of per file,
+        and symlinks via os.symlink on raw string paths. Files that already
+        exist at the destination are kept, so users can place custom files
+        that won't be overwritten. Returns (created, skipped, failed) counts.
+        """
+        created = skipped = failed = 0
+        log_debug = self.logger.isEnabledFor(logging.DEBUG)
+        os.makedirs(dst_dir, exist_ok=True)
+        with os.scandir(src_dir) as entries:
+            for entry in entries:
+                dst = dst_dir + os.sep + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    sub_created, sub_skipped, sub_failed = self._mirror_tree(entry.path, dst, instance_num)
+                    created += sub_created
+                    skipped += sub_skipped
+                    failed += sub_failed
+                else:
+                    c, s, f = self._link_file(entry.path, dst, instance_num, log_debug)
+                    created += c
+                    skipped += s
+                    failed += f
+        return created, skipped, failed
 
     def _verify_executable_symlink(self, instance: GameInstance, symlinked_exe_path_target: Path, original_exe_path: Path) -> None:
         """Verifies if the executable file exists at the target path, regardless of whether it's a symlink or a regular file."""
@@ -264,9 +534,9 @@ exec {gamescope_cmd_str} -- env LD_PRELOAD="$LD_PRELOAD_BAK" {proton_cmd_str}
         return script_path
 
     def _launch_single_instance(self, instance: GameInstance, profile: GameProfile,
-                              proton_path: Optional[Path], steam_root: Optional[Path], original_game_path: Path, cpu_affinity: str) -> None:
+                              proton_path: Optional[Path], steam_root: Optional[Path], original_game_path: Path, cpu_affinity: frozenset) -> None:
         """Launches a single game instance with CPU affinity."""
-        self.logger.info(f"Preparing instance {instance.instance_num} with CPU affinity: {cpu_affinity}...")
+        self.logger.info(f"Preparing instance {instance.instance_num} with CPU affinity: {sorted(cpu_affinity)}...")
 
         if not profile.exe_path:
             self.logger.error(f"Instance {instance.instance_num}: Executable path is missing in profile, cannot launch.")
@@ -279,34 +549,83 @@ exec {gamescope_cmd_str} -- env LD_PRELOAD="$LD_PRELOAD_BAK" {proton_cmd_str}
             profile # Passing the complete profile object
         )
 
-        # Validate devices for this instance
+        # Validate devices once per instance; downstream steps reuse the result.
         instance_idx = instance.instance_num - 1
         device_info = self._validate_input_devices(profile, instance_idx, instance.instance_num)
+        instance.device_info = device_info
 
         env = self._prepare_environment(instance, steam_root, proton_path, profile, device_info)
         cmd = self._build_command(profile, proton_path, instance, symlinked_executable_path, cpu_affinity, env)
 
         self.logger.info(f"Launching instance {instance.instance_num} (Log: {instance.log_file})")
+
         try:
-            with open(instance.log_file, 'w') as log:
-                process = subprocess.Popen(
-                    cmd,
-                    stdout=log,
-                    stderr=subprocess.STDOUT,
-                    # The env is now passed to the sandboxed process via bwrap's --setenv.
-                    # The bwrap process itself runs with the default environment.
-                    cwd=symlinked_executable_path.parent,
-                    preexec_fn=os.setpgrp
-                )
-            pid = process.pid
-            self.pids.append(pid)
+            pid = self._spawn(cmd, instance.log_file, symlinked_executable_path.parent)
+            with self._pids_lock:
+                self.pids.append(pid)
+                try:
+                    self._pgids.append(os.getpgid(pid))
+                except ProcessLookupError:
+                    pass  # Exited before we could read the pgid; nothing to track.
+                try:
+                    self._procs.append(psutil.Process(pid))
+                except psutil.NoSuchProcess:
+                    pass  # Died instantly; wait_procs has nothing to watch.
             instance.pid = pid
+            if cpu_affinity:
+                try:
+                    os.sched_setaffinity(pid, cpu_affinity)
+                except OSError as e:
+                    self.logger.warning(f"Instance {instance.instance_num}: Could not set CPU affinity {sorted(cpu_affinity)}: {e}")
             self.logger.info(f"Instance {instance.instance_num} started with PID: {pid}")
         except Exception as e:
             self.logger.error(f"Failed to launch instance {instance.instance_num}: {e}")
 
-    def _prepare_environment(self, instance: GameInstance, steam_root: Optional[Path], proton_path: Optional[Path], profile: Optional[GameProfile] = None, device_info: dict = {}) -> dict:
-        """Prepares a minimal environment for the game instance, plus device-specific vars."""
+    def _spawn(self, cmd: List[str], log_file: Path, workdir: Path) -> int:
+        """Spawns the instance command with stdout/stderr sent to its log file.
+
+        Prefers os.posix_spawnp, which avoids duplicating the (potentially
+        large) Python parent's page tables the way fork does and needs no
+        Python-level code between fork and exec. posix_spawn has no cwd
+        parameter; the command's bwrap prefix carries --chdir instead, and
+        the Popen fallback passes cwd for the same effect.
+        """
+        # The env is passed to the sandboxed process via bwrap's --setenv;
+        # the bwrap process itself runs with the parent's environment.
+        if hasattr(os, 'posix_spawnp'):
+            log_fd = os.open(str(log_file), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                return os.posix_spawnp(
+                    cmd[0], cmd, os.environ,
+                    file_actions=[
+                        (os.POSIX_SPAWN_DUP2, log_fd, 1),
+                        (os.POSIX_SPAWN_DUP2, log_fd, 2),
+                    ],
+                    # Each instance leads its own session/process group, so
+                    # terminate_all can kill the whole bwrap->gamescope->game
+                    # tree with a single killpg per instance.
+                    setsid=True,
+                )
+            finally:
+                os.close(log_fd)
+
+        with open(log_file, 'w') as log:
+            process = subprocess.Popen(
+                cmd,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                cwd=workdir,
+                start_new_session=True,
+            )
+        return process.pid
+
+    def _build_base_env(self, profile: Optional[GameProfile], steam_root: Optional[Path], proton_path: Optional[Path]) -> Dict[str, str]:
+        """Builds the environment shared by every instance of this launch.
+
+        Everything that doesn't depend on the instance number lives here, so
+        os.environ is copied once per launch instead of once per instance;
+        _prepare_environment then overlays only the per-instance keys.
+        """
         env = os.environ.copy()
         original_path = env.get('PATH', '')
 
@@ -318,8 +637,6 @@ exec {gamescope_cmd_str} -- env LD_PRELOAD="$LD_PRELOAD_BAK" {proton_cmd_str}
             # --- Essential Proton/Wine variables ---
             if steam_root:
                 env['STEAM_COMPAT_CLIENT_INSTALL_PATH'] = str(steam_root)
-            env['STEAM_COMPAT_DATA_PATH'] = str(instance.prefix_dir)
-            env['WINEPREFIX'] = str(instance.prefix_dir / 'pfx')
 
             # --- PATH modification ---
             if proton_path:
@@ -347,33 +664,46 @@ exec {gamescope_cmd_str} -- env LD_PRELOAD="$LD_PRELOAD_BAK" {proton_cmd_str}
             for key, value in profile.env_vars.items():
                 env[key] = value
 
+        return env
+
+    def _prepare_environment(self, instance: GameInstance, steam_root: Optional[Path], proton_path: Optional[Path], profile: Optional[GameProfile] = None, device_info: dict = {}) -> dict:
+        """Overlays per-instance variables onto the shared base environment."""
+        if self._base_env is None:
+            self._base_env = self._build_base_env(profile, steam_root, proton_path)
+
+        overlay: Dict[str, str] = {}
+
+        if not (profile and profile.is_native):
+            # --- Prefix paths are the only Proton variables that differ per instance ---
+            overlay['STEAM_COMPAT_DATA_PATH'] = str(instance.prefix_dir)
+            overlay['WINEPREFIX'] = str(instance.prefix_dir / 'pfx')
+
         # --- Device specific environment variables ---
         # Handle joystick assignment
         assigned_joystick_path = self._get_joystick_for_instance(instance, profile)
         if assigned_joystick_path:
-            env['SDL_JOYSTICK_DEVICE'] = assigned_joystick_path
-            self.logger.info(f"Instance {instance.instance_num}: Setting SDL_JOYSTICK_DEVICE to '{assigned_joystick_path}'.")
-        else:
-            env.pop('SDL_JOYSTICK_DEVICE', None)
+            overlay['SDL_JOYSTICK_DEVICE'] = assigned_joystick_path
 
         # Handle audio device assignment (PULSE_SINK for PulseAudio)
         if device_info.get('audio_device_id_for_instance'):
-            audio_device_id = device_info['audio_device_id_for_instance']
-            env['PULSE_SINK'] = audio_device_id
-            self.logger.info(f"Instance {instance.instance_num}: Setting PULSE_SINK to '{audio_device_id}'.")
-        else:
+            overlay['PULSE_SINK'] = device_info['audio_device_id_for_instance']
+
+        env = {**self._base_env, **overlay}
+        if 'SDL_JOYSTICK_DEVICE' not in overlay:
+            env.pop('SDL_JOYSTICK_DEVICE', None)
+        if 'PULSE_SINK' not in overlay:
             env.pop('PULSE_SINK', None)
 
-        self.logger.info(f"Instance {instance.instance_num}: Final environment prepared.")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Instance {instance.instance_num}: Environment overlay: {overlay}")
         return env
 
     def _get_joystick_for_instance(self, instance: GameInstance, profile: Optional[GameProfile]) -> Optional[str]:
         """Get joystick path for instance."""
-        if not profile or not profile.player_configs or not (0 <= instance.instance_num - 1 < len(profile.player_configs)):
+        player_config = self._player_config_for(profile, instance.instance_num - 1)
+        if not player_config:
             return None
 
-        idx = instance.instance_num - 1
-        player_config = profile.player_configs[idx]
         device_from_profile = player_config.PHYSICAL_DEVICE_ID
 
         if not device_from_profile or not device_from_profile.strip():
@@ -387,8 +717,12 @@ exec {gamescope_cmd_str} -- env LD_PRELOAD="$LD_PRELOAD_BAK" {proton_cmd_str}
         """Builds the command to run gamescope and the game (native or via Proton), using bwrap to isolate the control."""
         instance_idx = instance.instance_num - 1
 
-        # Validate input devices
-        device_info = self._validate_input_devices(profile, instance_idx, instance.instance_num)
+        # Reuse the device validation done in _launch_single_instance; the
+        # stat-heavy check only runs again if it hasn't happened yet.
+        device_info = instance.device_info
+        if device_info is None:
+            device_info = self._validate_input_devices(profile, instance_idx, instance.instance_num)
+            instance.device_info = device_info
 
         # Build Gamescope command
         gamescope_cmd = self._build_gamescope_command(profile, device_info['should_add_grab_flags'], instance.instance_num)
@@ -408,27 +742,41 @@ exec {gamescope_cmd_str} -- env LD_PRELOAD="$LD_PRELOAD_BAK" {proton_cmd_str}
         # Build bwrap command with devices
         bwrap_cmd = self._build_bwrap_command(profile, instance_idx, device_info, instance.instance_num, env)
 
+        # bwrap enters the game directory itself; the spawn path (posix_spawn)
+        # has no cwd parameter, so the working directory travels in the argv.
+        bwrap_cmd.extend(['--chdir', str(symlinked_exe_path.parent)])
+
         # Command without taskset for CPU affinity, to mirror user's script
         final_cmd = bwrap_cmd + base_cmd
-        # Use shlex.join for safer logging of the command
-        final_bwrap_cmd_str = shlex.join(final_cmd)
-        self.logger.info(f"Instance {instance.instance_num}: Full command: {final_bwrap_cmd_str}")
+        # The joined command runs to hundreds of elements (every --setenv
+        # triple); only build the string when DEBUG is actually emitted.
+        if self.logger.isEnabledFor(logging.DEBUG):
+            # Use shlex.join for safer logging of the command
+            self.logger.debug(f"Instance {instance.instance_num}: Full command: {shlex.join(final_cmd)}")
 
         return final_cmd
 
+    @staticmethod
+    def _player_config_for(profile: Optional[GameProfile], instance_idx: int) -> Optional[PlayerInstanceConfig]:
+        """Returns the player config for an instance index, or None if out of range."""
+        if not profile or not profile.player_configs:
+            return None
+        if 0 <= instance_idx < len(profile.player_configs):
+            return profile.player_configs[instance_idx]
+        return None
+
     def _validate_input_devices(self, profile: GameProfile, instance_idx: int, instance_num: int) -> dict:
         """Validates input devices and returns information about them."""
         has_dedicated_mouse = False
         mouse_path_str_for_instance = None
 
-        # Get specific player config
-        player_config = profile.player_configs[instance_idx] if profile.player_configs and 0 <= instance_idx < len(profile.player_configs) else None
+        player_config = self._player_config_for(profile, instance_idx)
 
         if player_config:
             mouse_path_str_for_instance = player_config.MOUSE_EVENT_PATH
             if mouse_path_str_for_instance and mouse_path_str_for_instance.strip():
                 mouse_path_obj = Path(mouse_path_str_for_instance)
-                if mouse_path_obj.exists() and mouse_path_obj.is_char_device():
+                if profile_cache.check_path_exists(mouse_path_obj) and mouse_path_obj.is_char_device():
                     has_dedicated_mouse = True
                 else:
                     self.logger.warning(f"Instance {instance_num}: Mouse device '{mouse_path_str_for_instance}' specified in profile but not found or not a char device.")
@@ -439,7 +787,7 @@ exec {gamescope_cmd_str} -- env LD_PRELOAD="$LD_PRELOAD_BAK" {proton_cmd_str}
             keyboard_path_str_for_instance = player_config.KEYBOARD_EVENT_PATH
             if keyboard_path_str_for_instance and keyboard_path_str_for_instance.strip():
                 keyboard_path_obj = Path(keyboard_path_str_for_instance)
-                if keyboard_path_obj.exists() and keyboard_path_obj.is_char_device():
+                if profile_cache.check_path_exists(keyboard_path_obj) and keyboard_path_obj.is_char_device():
                     has_dedicated_keyboard = True
                 else:
                     self.logger.warning(f"Instance {instance_num}: Keyboard device '{keyboard_path_str_for_instance}' specified in profile but not found or not a char device.")
@@ -461,33 +809,21 @@ exec {gamescope_cmd_str} -- env LD_PRELOAD="$LD_PRELOAD_BAK" {proton_cmd_str}
         }
 
     def _build_gamescope_command(self, profile: GameProfile, should_add_grab_flags: bool, instance_num: int) -> List[str]:
-        """Builds the Gamescope command."""
-        gamescope_path = 'gamescope'
-
+        """Builds the Gamescope command from the profile's precomputed flags."""
         # Get instance dimensions directly from the profile
         effective_width, effective_height = profile.get_instance_dimensions(instance_num)
 
+        # Static flags (FPS limits, borderless, adaptive sync) come from the
+        # profile's cached tuple; only geometry and grab flags vary here.
         gamescope_cli_options = [
-            gamescope_path,
-            '-b', # Use borderless instead of fullscreen for better compatibility
+            'gamescope',
             '-W', str(effective_width),
             '-H', str(effective_height),
             '-w', str(effective_width),
             '-h', str(effective_height),
+            *profile.gamescope_base_args,
         ]
 
-        # Always set an unfocused FPS limit to a very high value
-        gamescope_cli_options.extend(['-o', '999'])
-        self.logger.info(f"Instance {instance_num}: Setting unfocused FPS limit to 999.")
-
-        # Always set a focused FPS limit to a very high value
-        gamescope_cli_options.extend(['-r', '999'])
-        self.logger.info(f"Instance {instance_num}: Setting focused FPS limit to 999.")
-
-        # Add adaptive sync if not in splitscreen mode
-        if not profile.is_splitscreen_mode:
-            gamescope_cli_options.append('--adaptive-sync')
-
         if should_add_grab_flags:
             self.logger.info(f"Instance {instance_num}: Using dedicated mouse and keyboard. Adding --grab and --force-grab-cursor to Gamescope.")
             gamescope_cli_options.extend(['--grab', '--force-grab-cursor'])
@@ -523,30 +859,21 @@ exec {gamescope_cmd_str} -- env LD_PRELOAD="$LD_PRELOAD_BAK" {proton_cmd_str}
 
     def _build_bwrap_command(self, profile: GameProfile, instance_idx: int, device_info: dict, instance_num: int, env: Dict[str, str]) -> List[str]:
         """Builds the bwrap command, including device bindings and environment variables."""
+        device_paths_to_bind = self._collect_device_paths(profile, instance_idx, device_info, instance_num)
+
+        # Splice the dynamic triples onto the constant base in one list
+        # construction: --setenv passes the environment into the sandbox,
+        # --dev-bind exposes each validated input device.
         bwrap_cmd = [
-            'bwrap',
-            '--die-with-parent',
-            '--dev-bind', '/', '/',
-            '--proc', '/proc',
-            '--tmpfs', '/tmp',
-            '--cap-add', 'all',
-            '--share-net',
+            *self._BWRAP_BASE,
+            *itertools.chain.from_iterable(('--setenv', key, value) for key, value in env.items()),
+            *itertools.chain.from_iterable(('--dev-bind', path, path) for path in device_paths_to_bind),
         ]
 
-        # Pass environment variables into the sandbox
-        for key, value in env.items():
-            bwrap_cmd.extend(['--setenv', key, value])
-
-        device_paths_to_bind = self._collect_device_paths(profile, instance_idx, device_info, instance_num)
-
         if device_paths_to_bind:
-            bwrap_cmd.extend(['--tmpfs', '/dev/input'])
-            for device_path in device_paths_to_bind:
-                bwrap_cmd.extend(['--dev-bind', device_path, device_path])
-                self.logger.info(f"Instance {instance_num}: bwrap will bind '{device_path}' to '{device_path}'.")
+            self.logger.info(f"Instance {instance_num}: bwrap will bind {len(device_paths_to_bind)} input device(s).")
         else:
             self.logger.info(f"Instance {instance_num}: No specific input devices to bind with bwrap. Creating an empty isolated /dev/input.")
-            bwrap_cmd.extend(['--tmpfs', '/dev/input'])
 
         return bwrap_cmd
 
@@ -555,39 +882,50 @@ exec {gamescope_cmd_str} -- env LD_PRELOAD="$LD_PRELOAD_BAK" {proton_cmd_str}
         collected_paths = []
 
         # Joysticks
-        # Get specific player config
-        player_config = profile.player_configs[instance_idx] if profile.player_configs and 0 <= instance_idx < len(profile.player_configs) else None
+        player_config = self._player_config_for(profile, instance_idx)
 
+        log_debug = self.logger.isEnabledFor(logging.DEBUG)
         if player_config:
             joystick_path_str = player_config.PHYSICAL_DEVICE_ID
             if joystick_path_str and joystick_path_str.strip():
                 joystick_path = Path(joystick_path_str)
-                if joystick_path.exists() and joystick_path.is_char_device():
+                if profile_cache.check_path_exists(joystick_path) and joystick_path.is_char_device():
                     collected_paths.append(str(joystick_path))
-                    self.logger.info(f"Instance {instance_num}: Queued joystick '{joystick_path}' for bwrap binding.")
+                    if log_debug:
+                        self.logger.debug(f"Instance {instance_num}: Queued joystick '{joystick_path}' for bwrap binding.")
                 else:
                     self.logger.warning(f"Instance {instance_num}: Joystick device '{joystick_path_str}' specified in profile but not found or not a char device. Not binding.")
 
         # Mice - uses already validated variables
         if device_info['has_dedicated_mouse']:
             collected_paths.append(device_info['mouse_path_str_for_instance'])
-            self.logger.info(f"Instance {instance_num}: Queued mouse device '{device_info['mouse_path_str_for_instance']}' for bwrap binding.")
+            if log_debug:
+                self.logger.debug(f"Instance {instance_num}: Queued mouse device '{device_info['mouse_path_str_for_instance']}' for bwrap binding.")
 
         # Keyboards - uses already validated variables
         if device_info['has_dedicated_keyboard']:
             collected_paths.append(device_info['keyboard_path_str_for_instance'])
-            self.logger.info(f"Instance {instance_num}: Queued keyboard device '{device_info['keyboard_path_str_for_instance']}' for bwrap binding.")
+            if log_debug:
+                self.logger.debug(f"Instance {instance_num}: Queued keyboard device '{device_info['keyboard_path_str_for_instance']}' for bwrap binding.")
 
         return collected_paths
 
     def _is_any_process_running(self) -> bool:
-        """Checks if any of the managed PIDs are still running."""
-        if not self.pids:
+        """Reaps finished instances and reports whether any is still running.
+
+        Uses a single psutil.wait_procs over the tracked Process handles
+        instead of a per-PID /proc scan; exited processes are dropped from
+        both self._procs and self.pids as a side effect.
+        """
+        if not self._procs:
+            self.pids = []
             return False
 
-        alive_pids = [pid for pid in self.pids if psutil.pid_exists(pid)]
-        self.pids = alive_pids
-        return len(alive_pids) > 0
+        gone, alive = psutil.wait_procs(self._procs, timeout=0)
+        if gone:
+            self._procs = alive
+            self.pids = [p.pid for p in alive]
+        return bool(alive)
 
     def monitor_and_wait(self, parent_pid: Optional[int] = None) -> None:
         """
@@ -618,7 +956,10 @@ exec {gamescope_cmd_str} -- env LD_PRELOAD="$LD_PRELOAD_BAK" {proton_cmd_str}
                             self.logger.error(f"Failed to send SIGUSR1 to parent GUI (PID {parent_pid}): {e}")
                     break  # Exit if no instances are left
 
-                time.sleep(2)  # Poll every 2 seconds
+                # Block on the children themselves rather than sleeping: an
+                # instance exit wakes us immediately, while the 2 s timeout
+                # keeps the parent-liveness check above responsive.
+                psutil.wait_procs(self._procs, timeout=2)
         finally:
             self.logger.info("Monitoring loop finished. Performing final cleanup...")
             # We no longer need to call terminate_all() here if the parent is closing us,
@@ -635,20 +976,20 @@ exec {gamescope_cmd_str} -- env LD_PRELOAD="$LD_PRELOAD_BAK" {proton_cmd_str}
             self.termination_in_progress = True
             self.logger.info("Starting termination of all instances...")
 
-            # Terminate main process groups first
-            if self.pids:
-                self.logger.info(f"Terminating process groups for PIDs: {self.pids}")
-                for pid in self.pids:
+            # Terminate the recorded process groups first: one killpg per
+            # instance takes down bwrap, gamescope, proton and the game.
+            if self._pgids:
+                self.logger.info(f"Terminating process groups: {self._pgids}")
+                for pgid in self._pgids:
                     try:
-                        # Use os.killpg to terminate the entire process group
-                        os.killpg(pid, signal.SIGKILL)
-                        self.logger.info(f"Sent SIGKILL to process group of PID {pid}")
+                        os.killpg(pgid, signal.SIGKILL)
+                        self.logger.info(f"Sent SIGKILL to process group {pgid}")
                     except ProcessLookupError:
-                        self.logger.info(f"Process group for PID {pid} not found, likely already terminated.")
+                        self.logger.info(f"Process group {pgid} not found, likely already terminated.")
                     except Exception as e:
-                        self.logger.error(f"Failed to kill process group for PID {pid}: {e}")
+                        self.logger.error(f"Failed to kill process group {pgid}: {e}")
             else:
-                self.logger.info("No PIDs to terminate.")
+                self.logger.info("No process groups to terminate.")
 
             # Gracefully stop the wineserver for each non-native instance
             if self.managed_instances:
@@ -689,7 +1030,10 @@ exec {gamescope_cmd_str} -- env LD_PRELOAD="$LD_PRELOAD_BAK" {proton_cmd_str}
 
             # Clear internal state
             self.pids = []
+            self._pgids = []
+            self._procs = []
             self.managed_instances = []
+            self._io_pool.shutdown(wait=False, cancel_futures=True)
             self.logger.info("Instance termination and cleanup complete.")
         finally:
             self.termination_in_progress = False